@@ -12,22 +12,33 @@
 """
 
 import argparse
-import json
 import os
-import subprocess
+import sys
 from pathlib import Path
-from datetime import datetime
-from textwrap import dedent
+from types import SimpleNamespace
 
-PROJECT_TYPES = ["web-app", "service-api", "tool-script", "desktop-app"]
-TEMPLATES = ["default", "fintech-dapp", "electron-app"]
+PROJECT_TYPES = ("web-app", "service-api", "tool-script", "desktop-app")
+TEMPLATES = ("default", "fintech-dapp", "electron-app")
+
+# 帮助 / 提示文案在导入时拼好一次；用 list() 保持原先的展示格式
+_TEMPLATE_HELP = f"脚手架模板，默认 default，可选: {list(TEMPLATES)}"
+_TYPE_PROMPT = f"请选择项目类型 {list(PROJECT_TYPES)}"
+_TEMPLATE_PROMPT = f"请选择模板 {list(TEMPLATES)}"
 
 
 # -------- 通用小工具 --------
 
-def prompt_if_missing(value, prompt_text, default=None, choices=None):
+def prompt_if_missing(value, prompt_text, default=None, choices=None, interactive=True):
     if value:
         return value
+    if not interactive:
+        # 非交互模式下不读 stdin：有默认值直接用，否则报错
+        if default is not None:
+            return default
+        raise RuntimeError(f"非交互模式下缺少必需项：{prompt_text}")
+    # choices 可以是任意可迭代对象；校验用 frozenset，提示仍按原顺序展示
+    choices = list(choices) if choices else None
+    choices_set = frozenset(choices) if choices else None
     while True:
         if default is not None:
             raw = input(f"{prompt_text} [{default}]: ").strip()
@@ -36,7 +47,7 @@ def prompt_if_missing(value, prompt_text, default=None, choices=None):
         else:
             raw = input(f"{prompt_text}: ").strip()
 
-        if choices and raw not in choices:
+        if choices_set is not None and raw not in choices_set:
             print(f"请输入有效选项: {choices}")
             continue
         if raw:
@@ -44,337 +55,477 @@ def prompt_if_missing(value, prompt_text, default=None, choices=None):
 
 
 def write_file(path: Path, content: str, overwrite: bool = False):
-    if path.exists() and not overwrite:
+    """写入单个文件；父目录需已由目录创建阶段建好。
+
+    不覆盖时用 O_EXCL 打开，已存在则直接返回，省去一次 exists() 检查。
+    """
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_TRUNC if overwrite else os.O_EXCL)
+    try:
+        fd = os.open(str(path), flags, 0o666)
+    except FileExistsError:
         return
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+    try:
+        data = memoryview(content.encode("utf-8"))
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+def write_files(files, max_workers: int = 8):
+    """并发写入一批互不相关的 (path, content) 文件，重叠文件系统 I/O。"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        list(ex.map(lambda pc: write_file(*pc), files))
+
+
+def _dir_nonempty(p: Path) -> bool:
+    """只读取第一个目录项即返回，避免扫描整个目录。"""
+    try:
+        with os.scandir(p) as it:
+            return next(it, None) is not None
+    except FileNotFoundError:
+        return False
 
 
 # -------- 目录结构 --------
 
-def create_common_dirs(project_root: Path):
-    for d in ["docs", "tests", "scripts", "infra"]:
-        (project_root / d).mkdir(parents=True, exist_ok=True)
+def _batch_mkdir(project_root: Path, dirs):
+    """一次性创建 project_root 下的一批目录：按深度从浅到深排序，保证父目录先于子目录创建。
 
+    中间层目录会自动补进列表，因此每一级都只需一次普通 mkdir，
+    不必再用 parents=True / makedirs 逐级向上探测。
+    """
+    levels = set()
+    for d in dirs:
+        parts = d.relative_to(project_root).parts
+        levels.update(parts[:i] for i in range(1, len(parts) + 1))
 
-def create_type_dirs(project_root: Path, project_type: str):
-    src_root = project_root / "src"
-    src_root.mkdir(exist_ok=True)
+    root = str(project_root)
+    for parts in sorted(levels, key=len):
+        p = os.path.join(root, *parts)
+        try:
+            os.mkdir(p)
+        except FileExistsError:
+            if not os.path.isdir(p):
+                raise
 
-    if project_type == "web-app":
-        for d in ["frontend", "backend", "shared"]:
-            (src_root / d).mkdir(parents=True, exist_ok=True)
-        (project_root / "tests" / "frontend").mkdir(parents=True, exist_ok=True)
-        (project_root / "tests" / "backend").mkdir(parents=True, exist_ok=True)
 
-    elif project_type == "service-api":
-        for d in ["app", "core", "adapters"]:
-            (src_root / d).mkdir(parents=True, exist_ok=True)
+def create_common_dirs(paths: SimpleNamespace):
+    _batch_mkdir(paths.root, [paths.docs, paths.tests, paths.scripts, paths.infra, paths.src])
 
-    elif project_type == "tool-script":
-        for d in ["cli", "core"]:
-            (src_root / d).mkdir(parents=True, exist_ok=True)
 
-    elif project_type == "desktop-app":
-        # Electron 桌面应用目录
-        for d in ["main", "renderer", "preload", "shared"]:
-            (src_root / d).mkdir(parents=True, exist_ok=True)
-        # 可以为 E2E/集成测试预留一个目录
-        (project_root / "tests" / "e2e").mkdir(parents=True, exist_ok=True)
+# 各项目类型在 src/ 与 tests/ 下的子目录；新增类型只需在这里登记
+TYPE_DIRS = {
+    "web-app": ("frontend", "backend", "shared"),
+    "service-api": ("app", "core", "adapters"),
+    "tool-script": ("cli", "core"),
+    # Electron 桌面应用目录
+    "desktop-app": ("main", "renderer", "preload", "shared"),
+}
 
+EXTRA_TEST_DIRS = {
+    "web-app": ("frontend", "backend"),
+    # 可以为 E2E/集成测试预留一个目录
+    "desktop-app": ("e2e",),
+}
 
-# -------- 根部文件 --------
 
-def init_readme(project_root: Path, project_name: str, project_cn_name: str,
-                project_type: str, template: str):
-    readme_path = project_root / "README.md"
-    content = dedent(f"""
-    # {project_cn_name} ({project_name})
+def create_type_dirs(paths: SimpleNamespace, project_type: str):
+    dirs = [paths.src / d for d in TYPE_DIRS.get(project_type, ())]
+    dirs += [paths.tests / d for d in EXTRA_TEST_DIRS.get(project_type, ())]
+    _batch_mkdir(paths.root, dirs)
 
-    项目类型：**{project_type}**
-    使用模板：**{template}**
 
-    ## 简介
+# -------- 根部文件 --------
 
-    > 在这里用 2-3 句话描述这个项目解决什么问题，服务谁。
+README_TMPL = """\
+# {project_cn_name} ({project_name})
 
-    ## 快速开始
+项目类型：**{project_type}**
+使用模板：**{template}**
 
-    ```bash
-    # TODO: 填写项目初始化和启动命令
-    ```
+## 简介
 
-    ## 目录结构（初始）
+> 在这里用 2-3 句话描述这个项目解决什么问题，服务谁。
 
-    - `docs/`: 项目文档（需求、Roadmap、决策记录等）
-    - `src/`: 源码
-    - `tests/`: 测试
-    - `scripts/`: 脚本、自动化任务
-    - `infra/`: 部署、运维相关配置
-    """).strip() + "\n"
-    write_file(readme_path, content)
+## 快速开始
 
+```bash
+# TODO: 填写项目初始化和启动命令
+```
 
-def init_env_example(project_root: Path):
-    env_path = project_root / ".env.example"
-    content = dedent("""
-    # 环境变量示例（根据项目需要补充）
+## 目录结构（初始）
 
-    # APP_ENV=development
-    # APP_DEBUG=true
-    """).strip() + "\n"
-    write_file(env_path, content)
+- `docs/`: 项目文档（需求、Roadmap、决策记录等）
+- `src/`: 源码
+- `tests/`: 测试
+- `scripts/`: 脚本、自动化任务
+- `infra/`: 部署、运维相关配置
+"""
 
+ENV_EXAMPLE_TMPL = """\
+# 环境变量示例（根据项目需要补充）
 
-def init_license(project_root: Path):
-    license_path = project_root / "LICENSE"
-    content = dedent("""
-    MIT License (简化占位，按需替换为完整协议)
+# APP_ENV=development
+# APP_DEBUG=true
+"""
 
-    Copyright (c) {year}
-    """.format(year=datetime.now().year)).strip() + "\n"
-    write_file(license_path, content)
+LICENSE_TMPL = """\
+MIT License (简化占位，按需替换为完整协议)
 
+Copyright (c) {year}
+"""
 
-def init_changelog(project_root: Path):
-    changelog_path = project_root / "CHANGELOG.md"
-    today = datetime.now().strftime("%Y-%m-%d")
-    content = dedent(f"""
-    # Changelog
+CHANGELOG_TMPL = """\
+# Changelog
 
-    ## {today}
-    - 项目通过脚手架初始化。
-    """).strip() + "\n"
-    write_file(changelog_path, content)
+## {today}
+- 项目通过脚手架初始化。
+"""
 
 
 # -------- docs 模板 --------
 
-def init_docs(project_root: Path, meta: dict):
-    docs_root = project_root / "docs"
+BRIEF_TMPL = """\
+# Project Brief - {project_cn_name} ({project_name})
 
-    brief = dedent(f"""
-    # Project Brief - {meta['project_cn_name']} ({meta['project_name']})
+## 1. 项目一句话介绍
+> 用一两句话说明项目要解决的核心问题。
 
-    ## 1. 项目一句话介绍
-    > 用一两句话说明项目要解决的核心问题。
+## 2. 唯一成功指标（ONE metric）
+- 例：30 天内获取 30 个真实用户试用 / 完成 10 笔真实交易 / 录入 100 条数据 等
 
-    ## 2. 唯一成功指标（ONE metric）
-    - 例：30 天内获取 30 个真实用户试用 / 完成 10 笔真实交易 / 录入 100 条数据 等
+## 3. 目标用户
+- 地区：
+- 年龄段：
+- 职业 / 身份：
+- 使用场景：
 
-    ## 3. 目标用户
-    - 地区：
-    - 年龄段：
-    - 职业 / 身份：
-    - 使用场景：
+## 4. 不做什么（反边界）
+- 本期明确不做的功能/范围，避免越做越散。
 
-    ## 4. 不做什么（反边界）
-    - 本期明确不做的功能/范围，避免越做越散。
+## 5. MVP 要验证的核心假设
+1. 
+2. 
 
-    ## 5. MVP 要验证的核心假设
-    1. 
-    2. 
+## 6. 预估周期 & 时间投入
+- 预估周期：{duration_weeks} 周
+- 每周可投入时间：{hours_per_week} 小时
 
-    ## 6. 预估周期 & 时间投入
-    - 预估周期：{meta['duration_weeks']} 周
-    - 每周可投入时间：{meta['hours_per_week']} 小时
+## 7. 风险清单（TOP 3）
+1. 
+2. 
+3.
+"""
+
+ROADMAP_TMPL = """\
+# Roadmap
+
+> 只规划到 MVP，后续根据反馈再扩展。
 
-    ## 7. 风险清单（TOP 3）
-    1. 
-    2. 
-    3. 
-    """).strip() + "\n"
-    write_file(docs_root / "project-brief.md", brief)
+## Milestone 概览
 
-    roadmap = dedent("""
-    # Roadmap
+- M1：可点击 Demo（预计 1-2 周）
+- M2：第一批真实用户测试（预计 2-4 周）
+- M3：对外发布 & 迭代（可选）
 
-    > 只规划到 MVP，后续根据反馈再扩展。
+---
 
-    ## Milestone 概览
+## M1 - 可点击 Demo
 
-    - M1：可点击 Demo（预计 1-2 周）
-    - M2：第一批真实用户测试（预计 2-4 周）
-    - M3：对外发布 & 迭代（可选）
+### 1. 核心流程
+- [ ] 
 
-    ---
+### 2. 数据 & 配置
+- [ ] 
 
-    ## M1 - 可点击 Demo
+### 3. 运营 & 基础统计 / 埋点
+- [ ] 
 
-    ### 1. 核心流程
-    - [ ] 
+---
 
-    ### 2. 数据 & 配置
-    - [ ] 
+## M2 - 真实用户测试
 
-    ### 3. 运营 & 基础统计 / 埋点
-    - [ ] 
+### 1. 用户入口 & 注册 / 登录（如需要）
+- [ ] 
 
-    ---
+### 2. 关键行为闭环
+- [ ] 
 
-    ## M2 - 真实用户测试
+### 3. 反馈收集
+- [ ] 
 
-    ### 1. 用户入口 & 注册 / 登录（如需要）
-    - [ ] 
+---
 
-    ### 2. 关键行为闭环
-    - [ ] 
+## M3 - 对外发布 / 迭代（可选）
 
-    ### 3. 反馈收集
-    - [ ] 
+- [ ]
+"""
 
-    ---
+DEVLOG_TMPL = """\
+# Dev Log
 
-    ## M3 - 对外发布 / 迭代（可选）
+> 每天用 3 行记录进展，便于回顾和复盘。
 
-    - [ ] 
-    """).strip() + "\n"
-    write_file(docs_root / "roadmap.md", roadmap)
+## {today}
+- 今天完成：
+  - 项目初始化（脚手架创建目录与文档）
+- 遇到问题：
+  - 暂无
+- 明天最重要的一件事：
+  - 完成最小运行环境 / Hello World
+"""
 
-    today = datetime.now().strftime("%Y-%m-%d")
-    devlog = dedent(f"""
-    # Dev Log
+DECISIONS_TMPL = """\
+# Decisions Log
 
-    > 每天用 3 行记录进展，便于回顾和复盘。
+> 记录重要架构 / 技术 / 业务决策，方便将来回顾。
 
-    ## {today}
-    - 今天完成：
-      - 项目初始化（脚手架创建目录与文档）
-    - 遇到问题：
-      - 暂无
-    - 明天最重要的一件事：
-      - 完成最小运行环境 / Hello World
-    """).strip() + "\n"
-    write_file(docs_root / "dev-log.md", devlog)
+## YYYY-MM-DD - [决策标题示例]
+- 背景：
+- 选项：
+- 最终选择：
+- 原因：
+- 影响：
+"""
 
-    decisions = dedent("""
-    # Decisions Log
 
-    > 记录重要架构 / 技术 / 业务决策，方便将来回顾。
+# -------- 文件清单 --------
 
-    ## YYYY-MM-DD - [决策标题示例]
-    - 背景：
-    - 选项：
-    - 最终选择：
-    - 原因：
-    - 影响：
-    """).strip() + "\n"
-    write_file(docs_root / "decisions.md", decisions)
+# (相对路径, 模板)：统一用 render_files 渲染，模板中的字面花括号需写成 {{ }}
+ROOT_FILES = [
+    ("README.md", README_TMPL),
+    (".env.example", ENV_EXAMPLE_TMPL),
+    ("LICENSE", LICENSE_TMPL),
+    ("CHANGELOG.md", CHANGELOG_TMPL),
+]
+
+DOC_FILES = [
+    ("docs/project-brief.md", BRIEF_TMPL),
+    ("docs/roadmap.md", ROADMAP_TMPL),
+    ("docs/dev-log.md", DEVLOG_TMPL),
+    ("docs/decisions.md", DECISIONS_TMPL),
+]
+
+
+def render_files(paths: SimpleNamespace, manifest, context: dict):
+    """按清单渲染出 (path, content) 列表，交给 write_files 批量写入。"""
+    return [(paths.root / rel, tmpl.format(**context)) for rel, tmpl in manifest]
 
 
 # -------- 模板: fintech-dapp --------
 
-def apply_fintech_dapp_template(project_root: Path, project_type: str, meta: dict):
-    src_root = project_root / "src"
+FRONTEND_README_TMPL = """\
+# Frontend 结构（fintech-dapp 模板）
 
-    frontend_root = src_root / "frontend"
-    backend_root = src_root / "backend"
+- `pages/`: 页面级组件（路由对应）
+- `components/`: 可复用 UI 组件
+- `hooks/`: 自定义 hooks（如钱包连接、行情轮询）
+- `styles/`: 全局样式 / Tailwind 配置等
+"""
 
-    if frontend_root.exists():
-        for d in ["pages", "components", "hooks", "styles"]:
-            (frontend_root / d).mkdir(parents=True, exist_ok=True)
-
-        frontend_readme = dedent("""
-        # Frontend 结构（fintech-dapp 模板）
-
-        - `pages/`: 页面级组件（路由对应）
-        - `components/`: 可复用 UI 组件
-        - `hooks/`: 自定义 hooks（如钱包连接、行情轮询）
-        - `styles/`: 全局样式 / Tailwind 配置等
-        """).strip() + "\n"
-        write_file(frontend_root / "README.md", frontend_readme)
-
-    if backend_root.exists():
-        for d in ["api", "services", "models", "jobs"]:
-            (backend_root / d).mkdir(parents=True, exist_ok=True)
-
-        backend_readme = dedent("""
-        # Backend 结构（fintech-dapp 模板）
-
-        - `api/`: 对外暴露的接口（REST / GraphQL 等）
-        - `services/`: 业务服务层（撮合、风控、账户等）
-        - `models/`: 数据模型 / ORM
-        - `jobs/`: 定时任务（清算、统计、同步链上数据等）
-        """).strip() + "\n"
-        write_file(backend_root / "README.md", backend_readme)
-
-    infra_root = project_root / "infra"
-    docker_example = dedent("""
-    version: "3.9"
-
-    services:
-      backend:
-        image: backend-image-placeholder
-        container_name: backend
-        restart: unless-stopped
-        env_file:
-          - ../.env
-        ports:
-          - "8000:8000"
-
-      frontend:
-        image: frontend-image-placeholder
-        container_name: frontend
-        restart: unless-stopped
-        ports:
-          - "3000:3000"
-        environment:
-          - API_BASE_URL=http://backend:8000
-
-      db:
-        image: postgres:16
-        container_name: db
-        restart: unless-stopped
-        environment:
-          - POSTGRES_USER=app
-          - POSTGRES_PASSWORD=app
-          - POSTGRES_DB=app
-        volumes:
-          - db_data:/var/lib/postgresql/data
+BACKEND_README_TMPL = """\
+# Backend 结构（fintech-dapp 模板）
 
+- `api/`: 对外暴露的接口（REST / GraphQL 等）
+- `services/`: 业务服务层（撮合、风控、账户等）
+- `models/`: 数据模型 / ORM
+- `jobs/`: 定时任务（清算、统计、同步链上数据等）
+"""
+
+DOCKER_COMPOSE_TMPL = """\
+version: "3.9"
+
+services:
+  backend:
+    image: backend-image-placeholder
+    container_name: backend
+    restart: unless-stopped
+    env_file:
+      - ../.env
+    ports:
+      - "8000:8000"
+
+  frontend:
+    image: frontend-image-placeholder
+    container_name: frontend
+    restart: unless-stopped
+    ports:
+      - "3000:3000"
+    environment:
+      - API_BASE_URL=http://backend:8000
+
+  db:
+    image: postgres:16
+    container_name: db
+    restart: unless-stopped
+    environment:
+      - POSTGRES_USER=app
+      - POSTGRES_PASSWORD=app
+      - POSTGRES_DB=app
     volumes:
-      db_data:
-    """).strip() + "\n"
-    write_file(infra_root / "docker-compose.example.yml", docker_example)
+      - db_data:/var/lib/postgresql/data
+
+volumes:
+  db_data:
+"""
+
+FINTECH_NOTES_TMPL = """\
+# Fintech / Dapp 项目说明（模板自动生成）
+
+项目：{project_cn_name} ({project_name})
 
-    fintech_doc = dedent(f"""
-    # Fintech / Dapp 项目说明（模板自动生成）
+## 1. 产品定位
 
-    项目：{meta['project_cn_name']} ({meta['project_name']})
+- 目标用户：
+- 使用场景：
+- 解决什么核心问题：
 
-    ## 1. 产品定位
+## 2. 关键业务概念
 
-    - 目标用户：
-    - 使用场景：
-    - 解决什么核心问题：
+- 账户体系：
+- 资产类型（现金 / 合约 / 积分 / 链上资产 等）：
+- 交易品种：
+- 手续费 / 点差：
 
-    ## 2. 关键业务概念
+## 3. 合规 & 风控注意事项（思考框架）
 
-    - 账户体系：
-    - 资产类型（现金 / 合约 / 积分 / 链上资产 等）：
-    - 交易品种：
-    - 手续费 / 点差：
+- 用户身份（KYC）：
+- 资金来源合规性：
+- 风险提示机制：
+- 风控规则（限额、风控阈值等）：
 
-    ## 3. 合规 & 风控注意事项（思考框架）
+## 4. 技术要点（待补充）
 
-    - 用户身份（KYC）：
-    - 资金来源合规性：
-    - 风险提示机制：
-    - 风控规则（限额、风控阈值等）：
+- 钱包 / 支付渠道：
+- 行情数据源：
+- 撮合或定价模式：
+- 日志与监控：
+"""
+
+
+def apply_fintech_dapp_template(paths: SimpleNamespace, project_type: str, meta: dict):
+    cn, en = meta["project_cn_name"], meta["project_name"]
+    files = []
+    src_root = paths.src
+
+    frontend_root = src_root / "frontend"
+    backend_root = src_root / "backend"
 
-    ## 4. 技术要点（待补充）
+    has_frontend = frontend_root.exists()
+    has_backend = backend_root.exists()
 
-    - 钱包 / 支付渠道：
-    - 行情数据源：
-    - 撮合或定价模式：
-    - 日志与监控：
-    """).strip() + "\n"
-    write_file(project_root / "docs" / "fintech-notes.md", fintech_doc)
+    dirs = []
+    if has_frontend:
+        dirs += [frontend_root / d for d in ["pages", "components", "hooks", "styles"]]
+    if has_backend:
+        dirs += [backend_root / d for d in ["api", "services", "models", "jobs"]]
+    _batch_mkdir(paths.root, dirs)
+
+    if has_frontend:
+        files.append((frontend_root / "README.md", FRONTEND_README_TMPL))
+
+    if has_backend:
+        files.append((backend_root / "README.md", BACKEND_README_TMPL))
+
+    files.append((paths.infra / "docker-compose.example.yml", DOCKER_COMPOSE_TMPL))
+
+    fintech_doc = FINTECH_NOTES_TMPL.format(project_cn_name=cn, project_name=en)
+    files.append((paths.docs / "fintech-notes.md", fintech_doc))
+
+    return files
 
 
 # -------- 模板: electron-app --------
 
-def apply_electron_app_template(project_root: Path, project_type: str, meta: dict):
+ELECTRON_MAIN_README_TMPL = """\
+# main/ 主进程（Electron）
+
+职责建议：
+- 创建和管理 BrowserWindow
+- 处理应用生命周期（ready / activate / window-all-closed 等）
+- 注册全局快捷键 / 菜单 / 托盘
+- 负责安全敏感操作（文件访问、本地资源）并通过 IPC 暴露给 renderer
+- 不直接处理 UI 逻辑
+"""
+
+ELECTRON_RENDERER_README_TMPL = """\
+# renderer/ 渲染进程（前端 UI）
+
+建议：
+- 使用 React + Tailwind 或你熟悉的前端栈
+- 把页面按「功能」而不是「组件细节」划分目录，例如：
+  - `views/TradingPanel`
+  - `views/Settings`
+  - `views/Auth`
+- 所有调用主进程能力的地方都通过 preload 暴露的 API，而不是直接调用 Node API
+"""
+
+ELECTRON_PRELOAD_README_TMPL = """\
+# preload/ 预加载脚本
+
+职责：
+- 使用 contextBridge 暴露受控 API 给 window.xxx
+- 封装 IPC 调用，统一出入口
+- 控制可以被 renderer 访问的功能范围，增强安全性
+
+示例规划：
+- `ipc/`：封装不同业务域的 IPC 通道
+- `api/`：对外暴露给 renderer 调用的高层 API
+"""
+
+ELECTRON_SHARED_README_TMPL = """\
+# shared/ 共享模块
+
+建议放置内容：
+- IPC 通信的 channel 常量
+- 请求/响应的数据结构定义（TypeScript 类型 / JSON Schema 等）
+- 通用工具函数（日志、配置加载等）
+"""
+
+ELECTRON_NOTES_TMPL = """\
+# Electron 桌面应用设计笔记（模板自动生成）
+
+项目：{project_cn_name} ({project_name})
+
+## 1. 窗口规划
+
+- 主窗口：
+  - 尺寸：
+  - 是否可缩放：
+  - 是否支持多实例：
+- 其他窗口（设置 / 日志 / 弹窗等）：
+
+## 2. IPC 通信设计
+
+- 主要业务通道：
+  - 例：`channel: "auth/login"`，由 renderer 发起，main 处理
+- 约定：
+  - 所有 IPC 请求都带上 requestId，方便追踪
+  - 错误格式统一：`{{ code, message, detail }}`
+
+## 3. 安全策略
+
+- BrowserWindow 配置计划：
+  - 禁用 `nodeIntegration`
+  - 启用 `contextIsolation`
+  - 限制 `webSecurity` 设置
+- 外部链接处理：
+  - 在 main 中统一拦截并用默认浏览器打开
+- 文件读写：
+  - 仅允许通过 main 进程暴露的受控函数访问
+
+## 4. 技术栈约定（待补充）
+
+- 渲染进程前端栈：
+- 打包工具（electron-builder / forge / vite-electron 等）：
+- 更新策略（自动更新 / 手动更新）：
+"""
+
+
+def apply_electron_app_template(paths: SimpleNamespace, project_type: str, meta: dict):
     """
     Electron 桌面应用模板：
     - src/main     主进程
@@ -383,7 +534,9 @@ def apply_electron_app_template(project_root: Path, project_type: str, meta: dic
     - src/shared   公共协议、类型、常量
     - docs/electron-notes.md 记录窗口、IPC、安全规划
     """
-    src_root = project_root / "src"
+    cn, en = meta["project_cn_name"], meta["project_name"]
+    files = []
+    src_root = paths.src
     main_root = src_root / "main"
     renderer_root = src_root / "renderer"
     preload_root = src_root / "preload"
@@ -391,150 +544,90 @@ def apply_electron_app_template(project_root: Path, project_type: str, meta: dic
 
     # 主进程说明
     if main_root.exists():
-        main_readme = dedent("""
-        # main/ 主进程（Electron）
-
-        职责建议：
-        - 创建和管理 BrowserWindow
-        - 处理应用生命周期（ready / activate / window-all-closed 等）
-        - 注册全局快捷键 / 菜单 / 托盘
-        - 负责安全敏感操作（文件访问、本地资源）并通过 IPC 暴露给 renderer
-        - 不直接处理 UI 逻辑
-        """).strip() + "\n"
-        write_file(main_root / "README.md", main_readme)
+        files.append((main_root / "README.md", ELECTRON_MAIN_README_TMPL))
 
     # 渲染进程说明
     if renderer_root.exists():
-        renderer_readme = dedent("""
-        # renderer/ 渲染进程（前端 UI）
-
-        建议：
-        - 使用 React + Tailwind 或你熟悉的前端栈
-        - 把页面按「功能」而不是「组件细节」划分目录，例如：
-          - `views/TradingPanel`
-          - `views/Settings`
-          - `views/Auth`
-        - 所有调用主进程能力的地方都通过 preload 暴露的 API，而不是直接调用 Node API
-        """).strip() + "\n"
-        write_file(renderer_root / "README.md", renderer_readme)
+        files.append((renderer_root / "README.md", ELECTRON_RENDERER_README_TMPL))
 
     # preload 说明
     if preload_root.exists():
-        preload_readme = dedent("""
-        # preload/ 预加载脚本
-
-        职责：
-        - 使用 contextBridge 暴露受控 API 给 window.xxx
-        - 封装 IPC 调用，统一出入口
-        - 控制可以被 renderer 访问的功能范围，增强安全性
-
-        示例规划：
-        - `ipc/`：封装不同业务域的 IPC 通道
-        - `api/`：对外暴露给 renderer 调用的高层 API
-        """).strip() + "\n"
-        write_file(preload_root / "README.md", preload_readme)
+        files.append((preload_root / "README.md", ELECTRON_PRELOAD_README_TMPL))
 
     # shared 说明
     if shared_root.exists():
-        shared_readme = dedent("""
-        # shared/ 共享模块
-
-        建议放置内容：
-        - IPC 通信的 channel 常量
-        - 请求/响应的数据结构定义（TypeScript 类型 / JSON Schema 等）
-        - 通用工具函数（日志、配置加载等）
-        """).strip() + "\n"
-        write_file(shared_root / "README.md", shared_readme)
+        files.append((shared_root / "README.md", ELECTRON_SHARED_README_TMPL))
 
     # Electron 专项笔记文档
-    electron_notes = dedent(f"""
-    # Electron 桌面应用设计笔记（模板自动生成）
-
-    项目：{meta['project_cn_name']} ({meta['project_name']})
-
-    ## 1. 窗口规划
-
-    - 主窗口：
-      - 尺寸：
-      - 是否可缩放：
-      - 是否支持多实例：
-    - 其他窗口（设置 / 日志 / 弹窗等）：
+    electron_notes = ELECTRON_NOTES_TMPL.format(project_cn_name=cn, project_name=en)
+    files.append((paths.docs / "electron-notes.md", electron_notes))
 
-    ## 2. IPC 通信设计
+    return files
 
-    - 主要业务通道：
-      - 例：`channel: "auth/login"`，由 renderer 发起，main 处理
-    - 约定：
-      - 所有 IPC 请求都带上 requestId，方便追踪
-      - 错误格式统一：`{{ code, message, detail }}`
 
-    ## 3. 安全策略
-
-    - BrowserWindow 配置计划：
-      - 禁用 `nodeIntegration`
-      - 启用 `contextIsolation`
-      - 限制 `webSecurity` 设置
-    - 外部链接处理：
-      - 在 main 中统一拦截并用默认浏览器打开
-    - 文件读写：
-      - 仅允许通过 main 进程暴露的受控函数访问
+# -------- 模板选择路由 --------
 
-    ## 4. 技术栈约定（待补充）
+def _apply_default_template(paths: SimpleNamespace, project_type: str, meta: dict):
+    # default 模板就不做额外动作
+    return []
 
-    - 渲染进程前端栈：
-    - 打包工具（electron-builder / forge / vite-electron 等）：
-    - 更新策略（自动更新 / 手动更新）：
-    """).strip() + "\n"
-    write_file(project_root / "docs" / "electron-notes.md", electron_notes)
 
+# 模板名 -> 特化函数；新增模板只需在这里登记
+TEMPLATE_APPLIERS = {
+    "default": _apply_default_template,
+    "fintech-dapp": apply_fintech_dapp_template,
+    "electron-app": apply_electron_app_template,
+}
 
-# -------- 模板选择路由 --------
 
-def apply_template(project_root: Path, project_type: str, template: str, meta: dict):
-    if template == "fintech-dapp":
-        apply_fintech_dapp_template(project_root, project_type, meta)
-    elif template == "electron-app":
-        apply_electron_app_template(project_root, project_type, meta)
-    # default 模板就不做额外动作
+def apply_template(paths: SimpleNamespace, project_type: str, template: str, meta: dict):
+    applier = TEMPLATE_APPLIERS.get(template, _apply_default_template)
+    return applier(paths, project_type, meta)
 
 
 # -------- Meta & Git --------
 
-def write_project_meta(project_root: Path, meta: dict):
-    meta_path = project_root / "project_meta.json"
+def write_project_meta(paths: SimpleNamespace, meta: dict):
+    import json
+
+    meta_path = paths.root / "project_meta.json"
+    # 下划线开头的是运行期派生字段，不落盘
     meta_to_save = {
-        **meta,
-        "created_at": datetime.now().isoformat(),
+        **{k: v for k, v in meta.items() if not k.startswith("_")},
+        "created_at": meta["_created_at"],
         "scaffold_version": "3.0",
     }
-    write_file(meta_path, json.dumps(meta_to_save, ensure_ascii=False, indent=2) + "\n", overwrite=True)
+    # 直接流式写入文件，省去中间的整段 JSON 字符串
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(meta_to_save, f, ensure_ascii=False, indent=2)
+        f.write("\n")
 
 
-def git_init(project_root: Path):
-    try:
-        subprocess.run(
-            ["git", "--version"],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
-        )
-    except Exception:
+def git_init(paths: SimpleNamespace):
+    import shutil
+    import subprocess
+
+    # 进程内查 PATH，无需为探测 git 额外 fork 一次
+    if shutil.which("git") is None:
         print("⚠️ 未检测到 git，跳过 git 初始化。")
         return
 
-    if (project_root / ".git").exists():
+    if (paths.root / ".git").exists():
         print("ℹ️ 该目录已是 git 仓库，跳过 git init。")
         return
 
+    # 三个 git 进程即全部开销；-q 关掉 git 的进度输出
+    cwd = str(paths.root)
     try:
-        subprocess.run(["git", "init"], cwd=str(project_root), check=True)
-        subprocess.run(["git", "add", "."], cwd=str(project_root), check=True)
+        subprocess.run(["git", "init", "-q"], cwd=cwd, check=True)
+        subprocess.run(["git", "add", "-A"], cwd=cwd, check=True)
         subprocess.run(
-            ["git", "commit", "-m", "chore: init project from scaffold v3"],
-            cwd=str(project_root),
+            ["git", "commit", "-q", "-m", "chore: init project from scaffold v3"],
+            cwd=cwd,
             check=True,
         )
         print("✅ 已完成 git 初始化并创建初始提交。")
-    except Exception as e:
+    except subprocess.CalledProcessError as e:
         print(f"⚠️ git 初始化失败：{e}")
 
 
@@ -549,9 +642,11 @@ def parse_args():
         "--template",
         dest="template",
         choices=TEMPLATES,
-        help=f"脚手架模板，默认 default，可选: {TEMPLATES}",
+        help=_TEMPLATE_HELP,
     )
     parser.add_argument("--base-dir", dest="base_dir", help="项目创建基础目录，默认当前目录")
+    parser.add_argument("--weeks", dest="duration_weeks", help="预估项目周期（周），默认 4")
+    parser.add_argument("--hours", dest="hours_per_week", help="每周可投入时间（小时），默认 20")
     parser.add_argument("--no-git", action="store_true", help="不自动初始化 git 仓库")
     return parser.parse_args()
 
@@ -559,41 +654,73 @@ def parse_args():
 def main():
     args = parse_args()
 
+    # CI / 管道等非交互环境下不等待输入，缺少必需参数直接失败
+    interactive = sys.stdin.isatty()
+    if not interactive and not (args.project_name and args.project_type):
+        print("非交互模式下必须通过命令行参数提供所有必需项（project_name、--type）", file=sys.stderr)
+        sys.exit(2)
+
     project_name = prompt_if_missing(
         args.project_name,
-        "请输入项目英文机器名 (如 fintech-x-app-202511)"
+        "请输入项目英文机器名 (如 fintech-x-app-202511)",
+        interactive=interactive,
     )
     project_cn_name = prompt_if_missing(
         args.project_cn_name,
         "请输入项目中文名",
-        default=project_name
+        default=project_name,
+        interactive=interactive,
     )
     project_type = prompt_if_missing(
         args.project_type,
-        f"请选择项目类型 {PROJECT_TYPES}",
-        choices=PROJECT_TYPES
+        _TYPE_PROMPT,
+        choices=PROJECT_TYPES,
+        interactive=interactive,
     )
     template = prompt_if_missing(
         args.template,
-        f"请选择模板 {TEMPLATES}",
+        _TEMPLATE_PROMPT,
         default="default",
-        choices=TEMPLATES
+        choices=TEMPLATES,
+        interactive=interactive,
     )
 
     base_dir = args.base_dir or os.getcwd()
-    duration_weeks = prompt_if_missing(None, "预估项目周期（周）", default="4")
-    hours_per_week = prompt_if_missing(None, "每周可投入时间（小时）", default="20")
+    duration_weeks = prompt_if_missing(
+        args.duration_weeks,
+        "预估项目周期（周）",
+        default="4",
+        interactive=interactive,
+    )
+    hours_per_week = prompt_if_missing(
+        args.hours_per_week,
+        "每周可投入时间（小时）",
+        default="20",
+        interactive=interactive,
+    )
 
     project_root = Path(base_dir).expanduser().resolve() / project_name
 
-    if project_root.exists() and any(project_root.iterdir()):
+    if project_root.exists() and _dir_nonempty(project_root):
         print(f"⚠️ 目标目录已存在且非空：{project_root}")
+        if not interactive:
+            print("非交互模式下无法确认覆盖，已取消。", file=sys.stderr)
+            sys.exit(2)
         confirm = input("继续可能覆盖部分文件，是否继续？(y/N): ").strip().lower()
         if confirm != "y":
             print("已取消。")
             return
 
     project_root.mkdir(parents=True, exist_ok=True)
+    # 常用子路径只拼接一次，后续各步骤直接复用
+    paths = SimpleNamespace(
+        root=project_root,
+        docs=project_root / "docs",
+        src=project_root / "src",
+        tests=project_root / "tests",
+        infra=project_root / "infra",
+        scripts=project_root / "scripts",
+    )
 
     meta = {
         "project_name": project_name,
@@ -603,25 +730,29 @@ def main():
         "duration_weeks": duration_weeks,
         "hours_per_week": hours_per_week,
     }
+    # 整个运行只取一次当前时间，保证各文件中的日期一致
+    from datetime import datetime
+
+    now = datetime.now()
+    meta["_today"] = now.strftime("%Y-%m-%d")
+    meta["_year"] = now.year
+    meta["_created_at"] = now.isoformat()
 
     # 1. 通用目录
-    create_common_dirs(project_root)
+    create_common_dirs(paths)
     # 2. 类型目录
-    create_type_dirs(project_root, project_type)
-    # 3. 根部文件
-    init_readme(project_root, project_name, project_cn_name, project_type, template)
-    init_env_example(project_root)
-    init_license(project_root)
-    init_changelog(project_root)
-    # 4. docs 模板
-    init_docs(project_root, meta)
+    create_type_dirs(paths, project_type)
+    # 3. 根部文件 + 4. docs 模板
+    context = {**meta, "today": meta["_today"], "year": meta["_year"]}
+    files = render_files(paths, ROOT_FILES + DOC_FILES, context)
     # 5. 模板特化逻辑
-    apply_template(project_root, project_type, template, meta)
+    files += apply_template(paths, project_type, template, meta)
+    write_files(files)
     # 6. meta 信息
-    write_project_meta(project_root, meta)
+    write_project_meta(paths, meta)
     # 7. git 初始化
     if not args.no_git:
-        git_init(project_root)
+        git_init(paths)
 
     print("\n🎉 脚手架已完成项目初始化：")
     print(f"   位置：{project_root}")